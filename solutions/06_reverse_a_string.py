@@ -1,3 +1,12 @@
+import mmap
+import os
+from array import array
+
+# Size (in characters for text, in bytes for binary input) of each block
+# read from either end by is_palindrome_streaming.
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
 def is_palindrome(s):
     """
     Function to check whether a given string is a palindrome.
@@ -16,6 +25,320 @@ def is_palindrome(s):
     return normalized_str == normalized_str[::-1]
 
 
+def _is_continuation_byte(byte):
+    """
+    Check whether a byte is a UTF-8 continuation byte (0b10xxxxxx).
+    """
+    return byte & 0xC0 == 0x80
+
+
+def _forward_text_chunks(text, chunk_size):
+    """
+    Yield (start, end, chunk) blocks of a string from the front.
+    """
+    for start in range(0, len(text), chunk_size):
+        end = min(start + chunk_size, len(text))
+        yield start, end, text[start:end]
+
+
+def _backward_text_chunks(text, chunk_size):
+    """
+    Yield (start, end, chunk) blocks of a string from the back.
+    """
+    for end in range(len(text), 0, -chunk_size):
+        start = max(end - chunk_size, 0)
+        yield start, end, text[start:end]
+
+
+def _forward_buffer_chunks(buffer, chunk_size):
+    """
+    Yield (start, end, chunk) UTF-8 decoded blocks of a buffer from the front.
+
+    Each block is widened so it ends on a character boundary.
+    """
+    size = len(buffer)
+    start = 0
+    while start < size:
+        end = min(start + chunk_size, size)
+        while end < size and _is_continuation_byte(buffer[end]):
+            end += 1
+        yield start, end, str(buffer[start:end], "utf-8")
+        start = end
+
+
+def _backward_buffer_chunks(buffer, chunk_size):
+    """
+    Yield (start, end, chunk) UTF-8 decoded blocks of a buffer from the back.
+
+    Each block is widened so it starts on a character boundary.
+    """
+    end = len(buffer)
+    while end > 0:
+        start = max(end - chunk_size, 0)
+        while start > 0 and _is_continuation_byte(buffer[start]):
+            start -= 1
+        yield start, end, str(buffer[start:end], "utf-8")
+        end = start
+
+
+def _compare_from_both_ends(forward, backward):
+    """
+    Compare a forward and a backward block stream of the same source.
+
+    Both streams yield (start, end, chunk) tuples in the same position units.
+    Blocks are casefolded one at a time, so only one block per side is held
+    in memory. Comparison stops at the first mismatch, or as soon as the
+    forward block lies entirely after the backward block, because every
+    remaining pair is then the mirror of a pair that was already compared.
+    """
+    front = back = ""
+    front_pos = back_pos = 0
+    front_start = 0
+    back_end = None
+
+    while True:
+        if front_pos == len(front):
+            block = next(forward, None)
+            if block is None:
+                return True
+            front_start, _, chunk = block
+            front, front_pos = chunk.casefold(), 0
+        if back_pos == len(back):
+            block = next(backward, None)
+            if block is None:
+                return True
+            _, back_end, chunk = block
+            back, back_pos = chunk.casefold()[::-1], 0
+        if front_start >= back_end:
+            return True
+
+        length = min(len(front) - front_pos, len(back) - back_pos)
+        if front[front_pos : front_pos + length] != back[back_pos : back_pos + length]:
+            return False
+        front_pos += length
+        back_pos += length
+
+
+def is_palindrome_streaming(source, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Check whether a text is a palindrome without copying it.
+
+    Unlike is_palindrome, the input is never lowercased or reversed as a
+    whole. Fixed-size blocks are read from both ends, casefolded (the
+    Unicode-correct form of ignoring case) and compared, stopping at the
+    first mismatch, so even a multi-gigabyte file is checked in constant
+    memory.
+
+    Parameters:
+    source (str | bytes | bytearray | memoryview | mmap.mmap | os.PathLike):
+        The text to check. A str is checked as is, bytes-like objects and
+        memory-mapped buffers are decoded as UTF-8, and a path-like object
+        (e.g. pathlib.Path) names a UTF-8 file that is memory-mapped. A
+        memoryview must be C-contiguous (not a strided slice).
+    chunk_size (int): The number of characters (or bytes) read per block.
+
+    Returns:
+    bool: True if the text is a palindrome, False otherwise.
+
+    Raises:
+    TypeError: If source is not one of the supported types, or is a
+        memoryview that is not C-contiguous.
+    ValueError: If chunk_size is not a positive integer.
+    UnicodeDecodeError: If binary input is not valid UTF-8.
+    """
+    if not isinstance(chunk_size, int) or chunk_size <= 0:
+        raise ValueError("chunk_size must be a positive integer.")
+
+    if isinstance(source, str):
+        return _compare_from_both_ends(
+            _forward_text_chunks(source, chunk_size),
+            _backward_text_chunks(source, chunk_size),
+        )
+
+    if isinstance(source, os.PathLike):
+        with open(source, "rb") as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return True
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                return is_palindrome_streaming(buffer, chunk_size)
+
+    if isinstance(source, (bytes, bytearray, mmap.mmap)):
+        buffer = source
+    elif isinstance(source, memoryview):
+        if not source.c_contiguous:
+            raise TypeError("memoryview sources must be C-contiguous.")
+        buffer = source.cast("B")
+    else:
+        raise TypeError("source must be a str, a bytes-like object or a path.")
+
+    return _compare_from_both_ends(
+        _forward_buffer_chunks(buffer, chunk_size),
+        _backward_buffer_chunks(buffer, chunk_size),
+    )
+
+
+def _lower_case(s):
+    """
+    Lowercase a string like is_palindrome does, keeping its length.
+
+    Characters are lowercased one at a time with str.lower(), so the answers
+    match is_palindrome except for two characters:
+
+    - "İ" is kept as it is, because its lowercase form is two characters
+      ("i" plus a combining dot) and indices must match indices into s.
+      It therefore only matches another "İ".
+    - Capital sigma always becomes "σ". Whole-string lower() turns it into
+      "ς" at the end of a word, but that depends on where a substring ends,
+      so it cannot be precomputed.
+    """
+    lowered = s.lower()
+    if len(lowered) == len(s) and "Σ" not in s:
+        return lowered
+    return "".join(char.lower() if len(char.lower()) == 1 else char for char in s)
+
+
+class PalindromeIndex:
+    """
+    A precomputed index answering palindrome questions about one string.
+
+    The index is built once in O(n) time with Manacher's algorithm, ignoring
+    case with str.lower() like is_palindrome (see _lower_case for the two
+    exceptions, "İ" and capital sigma). It stores, for each of the 2n + 1 possible
+    centres of a palindrome (every character and every gap between
+    characters), the length of the longest palindrome around that centre in
+    a compact integer array. Every range query is then answered in O(1).
+
+    Attributes:
+    radii (array): For the centre between s[k - 1] and s[k] at index 2k, and
+        the centre on s[k] at index 2k + 1, the length of the longest
+        palindromic substring of s around that centre.
+
+    Examples:
+        >>> index = PalindromeIndex("abaXYZzyx")
+        >>> index.is_palindrome(0, 3)
+        True
+        >>> index.are_palindromes([(3, 9), (0, 4)])
+        [True, False]
+        >>> index.longest()
+        'XYZzyx'
+    """
+
+    def __init__(self, s):
+        """
+        Build the index for a string.
+
+        Parameters:
+        s (str): The string to index.
+
+        Raises:
+        TypeError: If s is not a string.
+        """
+        if not isinstance(s, str):
+            raise TypeError("s must be a string.")
+
+        self._text = s
+        self.radii = self._manacher(_lower_case(s))
+
+    @staticmethod
+    def _manacher(text):
+        """
+        Compute the palindrome length around every centre of text.
+
+        The centres are those of text interleaved with separators
+        ("#a#b#"), which lets even- and odd-length palindromes be handled
+        alike without building the interleaved string.
+        """
+        size = 2 * len(text) + 1
+        radii = array("i" if size < 2**31 else "q", [0]) * size
+
+        center = right = 0
+        for t in range(size):
+            radius = min(right - t, radii[2 * center - t]) if t < right else 0
+            # Positions t - radius - 1 and t + radius + 1 have the same parity:
+            # even ones are both separators, odd ones hold characters.
+            while (
+                radius < t
+                and t + radius + 1 < size
+                and (
+                    (t - radius) % 2 == 1
+                    or text[(t - radius - 2) // 2] == text[(t + radius) // 2]
+                )
+            ):
+                radius += 1
+            radii[t] = radius
+            if t + radius > right:
+                center, right = t, t + radius
+        return radii
+
+    def __len__(self):
+        """
+        Return the length of the indexed string.
+        """
+        return len(self._text)
+
+    def is_palindrome(self, start, stop):
+        """
+        Check whether s[start:stop] is a palindrome, ignoring case.
+
+        Parameters:
+        start (int): The index of the first character of the substring.
+        stop (int): The index just past the last character of the substring.
+
+        Returns:
+        bool: True if the substring is a palindrome, False otherwise.
+
+        Raises:
+        IndexError: If 0 <= start <= stop <= len(s) does not hold.
+        """
+        if not 0 <= start <= stop <= len(self._text):
+            raise IndexError(f"Invalid substring range: ({start}, {stop})")
+        return self.radii[start + stop] >= stop - start
+
+    def are_palindromes(self, ranges):
+        """
+        Check a batch of (start, stop) ranges with is_palindrome.
+
+        Parameters:
+        ranges (Iterable[Tuple[int, int]]): The substring ranges to check.
+
+        Returns:
+        List[bool]: One result per range, in the same order.
+
+        Raises:
+        IndexError: If any range is invalid.
+        """
+        size = len(self._text)
+        radii = self.radii
+        results = []
+        for start, stop in ranges:
+            if not 0 <= start <= stop <= size:
+                raise IndexError(f"Invalid substring range: ({start}, {stop})")
+            results.append(radii[start + stop] >= stop - start)
+        return results
+
+    def longest(self):
+        """
+        Return the longest palindromic substring (the first one on ties).
+
+        Returns:
+        str: The longest palindromic substring, or "" for an empty string.
+        """
+        radii = self.radii
+        center = max(range(len(radii)), key=radii.__getitem__)
+        start = (center - radii[center]) // 2
+        return self._text[start : start + radii[center]]
+
+    def count(self):
+        """
+        Count the non-empty palindromic substrings, by position.
+
+        Returns:
+        int: The number of (start, stop) ranges with stop > start whose
+        substring is a palindrome.
+        """
+        return sum((radius + 1) // 2 for radius in self.radii)
+
+
 # Test Cases
 def test_is_palindrome():
     """
@@ -40,4 +363,5 @@ def test_is_palindrome():
 
 
 # Run Tests
-test_is_palindrome()
+if __name__ == "__main__":
+    test_is_palindrome()
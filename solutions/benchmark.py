@@ -0,0 +1,408 @@
+"""
+Benchmarks for the solutions package.
+
+Each benchmark runs one function over a sweep of input sizes and records
+the best time per call (with timeit) and the peak memory allocated during
+one call (with tracemalloc). The import time of every solutions module is
+measured in a fresh interpreter, so it includes everything the module does
+when it is imported. Every measurement is taken in several passes spread over
+the run, and the fastest is kept.
+
+Each batch form is also compared with a loop over its scalar function at the
+same sizes, and is reported if it is not faster.
+
+Results are compared with a stored baseline (benchmark_baseline.json next to
+this file) and any time or allocation that grew by more than the tolerance
+is reported as a regression, unless it grew by less than a small absolute
+amount that is within timing noise. Timings depend on the machine, so record a
+whole new baseline with --save when moving to a new one.
+
+Usage:
+    python -m solutions.benchmark            # compare with the baseline
+    python -m solutions.benchmark --quick    # smaller sizes only
+    python -m solutions.benchmark --save     # store a new baseline
+"""
+
+import argparse
+import importlib
+import json
+import os
+import subprocess
+import sys
+import timeit
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "benchmark_baseline.json")
+
+# A measurement regresses if it grows by more than this fraction.
+DEFAULT_TOLERANCE = 0.5
+
+# A measurement only regresses if it also grows by more than these amounts:
+# smaller changes are within the noise of a timing run. Import times are
+# sampled from whole interpreter start-ups, so they are noisier still.
+MIN_SECONDS = 1e-3
+MIN_IMPORT_SECONDS = 3e-3
+MIN_BYTES = 4096
+
+# A run makes ROUNDS passes over every import and benchmark and keeps the
+# fastest sample of each, so a slow spell of the machine only spoils one pass.
+# Each pass takes CALL_REPEAT timing rounds per benchmark and starts
+# IMPORT_REPEAT interpreters per import.
+ROUNDS = 3
+CALL_REPEAT = 3
+IMPORT_REPEAT = 3
+
+# Modules whose import time is measured. game_of_life is left out because it
+# needs a display.
+SOLUTION_MODULES = [
+    "solutions",
+    "solutions.05_calculate_the_factorial_of_a_number",
+    "solutions.06_reverse_a_string",
+    "solutions.check_even_or_odd",
+    "solutions.find_largest_number",
+    "solutions.find_partitions",
+    "solutions.find_the_maximum_of_two_numbers",
+    "solutions.merge_two_given_lists",
+]
+
+# Pairs of benchmarks swept over the same sizes: the first, a batch form, must
+# be faster than the second, a loop over the scalar function.
+SPEEDUPS = [
+    ("check_even_or_odd_batch", "check_even_or_odd"),
+    ("find_the_maximum_of_two_numbers_batch", "find_the_maximum_of_two_numbers"),
+]
+
+
+@dataclass
+class Benchmark:
+    """
+    One function to benchmark over several input sizes.
+
+    - setup builds the arguments of one call for a given size.
+    - run calls the benchmarked function with those arguments.
+    - sizes are the input sizes of the sweep; only the first quick_sizes
+      are used by a quick run.
+    """
+
+    name: str
+    setup: Callable[[int], Tuple[Any, ...]]
+    run: Callable[..., Any]
+    sizes: List[int]
+    quick_sizes: int = 2
+
+
+def _function(module: str, name: str) -> Callable[..., Any]:
+    """
+    Import a function from a solutions module, including those whose names
+    start with a digit.
+    """
+    return getattr(importlib.import_module(f"solutions.{module}"), name)
+
+
+def _palindrome(size: int) -> Tuple[str]:
+    """
+    Build a mixed-case palindrome of the given size.
+    """
+    half = "".join(chr(ord("a") + i % 26) for i in range(size // 2))
+    return (half + half[::-1].upper(),)
+
+
+def _call_many(function: Callable[..., Any]) -> Callable[..., None]:
+    """
+    Wrap a scalar function so one run calls it once per pair of arguments.
+    """
+
+    def run(arguments: List[Tuple[int, ...]]) -> None:
+        for args in arguments:
+            function(*args)
+
+    return run
+
+
+def _benchmarks() -> List[Benchmark]:
+    """
+    Build the list of benchmarks, importing the benchmarked functions.
+    """
+    return [
+        Benchmark(
+            "find_partitions",
+            lambda size: (size, size),
+            _function("find_partitions", "find_partitions"),
+            [8, 12, 16],
+        ),
+        Benchmark(
+            "calculate_factorial",
+            lambda size: (size,),
+            _function("05_calculate_the_factorial_of_a_number", "calculate_factorial"),
+            [100, 1000, 5000],
+        ),
+        Benchmark(
+            "is_palindrome",
+            _palindrome,
+            _function("06_reverse_a_string", "is_palindrome"),
+            [1000, 100_000, 1_000_000],
+        ),
+        Benchmark(
+            "merge_two_given_lists",
+            lambda size: (list(range(size)), list(range(size))),
+            _function("merge_two_given_lists", "merge_two_given_lists"),
+            [1000, 100_000, 1_000_000],
+        ),
+        Benchmark(
+            "find_largest_number",
+            lambda size: ([(i * 7919) % size for i in range(size)],),
+            _function("find_largest_number", "find_largest_number"),
+            [1000, 100_000, 1_000_000],
+        ),
+        Benchmark(
+            "check_even_or_odd",
+            lambda size: ([(i,) for i in range(size)],),
+            _call_many(_function("check_even_or_odd", "check_even_or_odd")),
+            [1000, 100_000],
+        ),
+        Benchmark(
+            "find_the_maximum_of_two_numbers",
+            lambda size: ([(i, size - i) for i in range(size)],),
+            _call_many(
+                _function(
+                    "find_the_maximum_of_two_numbers",
+                    "find_the_maximum_of_two_numbers",
+                )
+            ),
+            [1000, 100_000],
+        ),
+        Benchmark(
+            "check_even_or_odd_batch",
+            lambda size: (list(range(size)),),
+            _function("check_even_or_odd", "check_even_or_odd_batch"),
+            [1000, 100_000],
+        ),
+        Benchmark(
+            "find_the_maximum_of_two_numbers_batch",
+            lambda size: (list(range(size)), [size - i for i in range(size)]),
+            _function(
+                "find_the_maximum_of_two_numbers",
+                "find_the_maximum_of_two_numbers_batch",
+            ),
+            [1000, 100_000],
+        ),
+    ]
+
+
+def measure_call(
+    function: Callable[..., Any], args: Tuple[Any, ...], repeat: int = 3
+) -> Dict[str, float]:
+    """
+    Measure the best time and the peak allocations of one call.
+
+    Args:
+        function (Callable[..., Any]): The function to call.
+        args (Tuple[Any, ...]): The arguments to call it with.
+        repeat (int): The number of timing rounds; the fastest one is kept.
+
+    Returns:
+        Dict[str, float]: The seconds per call and the peak bytes allocated.
+    """
+    timer = timeit.Timer(lambda: function(*args))
+    number, _ = timer.autorange()
+    seconds = min(timer.repeat(repeat=repeat, number=number)) / number
+
+    tracemalloc.start()
+    try:
+        function(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {"seconds": seconds, "peak_bytes": peak}
+
+
+def measure_import(module: str, repeat: int = IMPORT_REPEAT) -> Dict[str, float]:
+    """
+    Measure how long a module takes to import in a fresh interpreter.
+
+    Args:
+        module (str): The dotted name of the module.
+        repeat (int): The number of interpreters to start; the fastest
+            import is kept.
+
+    Returns:
+        Dict[str, float]: The seconds spent importing the module.
+    """
+    code = (
+        "import importlib, time\n"
+        "start = time.perf_counter()\n"
+        f"importlib.import_module({module!r})\n"
+        "print(time.perf_counter() - start)\n"
+    )
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    samples = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=root,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        samples.append(float(output.split()[-1]))
+    return {"seconds": min(samples)}
+
+
+def run_benchmarks(
+    quick: bool = False, rounds: int = ROUNDS
+) -> Dict[str, Dict[str, float]]:
+    """
+    Run every benchmark and import measurement.
+
+    Args:
+        quick (bool): If True, only run the smaller sizes of each sweep.
+        rounds (int): The number of passes; the fastest time of each
+            measurement is kept.
+
+    Returns:
+        Dict[str, Dict[str, float]]: The measurements, keyed by
+        "name[size]" for benchmarks and "import module" for imports.
+    """
+    results: Dict[str, Dict[str, float]] = {}
+
+    def keep_fastest(name: str, metrics: Dict[str, float]) -> None:
+        if name not in results or metrics["seconds"] < results[name]["seconds"]:
+            results[name] = metrics
+
+    for _ in range(rounds):
+        for module in SOLUTION_MODULES:
+            keep_fastest(f"import {module}", measure_import(module))
+        for benchmark in _benchmarks():
+            sizes = benchmark.sizes
+            if quick:
+                sizes = sizes[: benchmark.quick_sizes]
+            for size in sizes:
+                args = benchmark.setup(size)
+                keep_fastest(
+                    f"{benchmark.name}[{size}]",
+                    measure_call(benchmark.run, args, repeat=CALL_REPEAT),
+                )
+    return results
+
+
+def find_regressions(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> List[str]:
+    """
+    Compare measurements with a baseline.
+
+    Measurements missing from the baseline are not compared. A measurement
+    regresses if it grew by more than the tolerance and by more than
+    MIN_SECONDS (MIN_IMPORT_SECONDS for imports) or MIN_BYTES.
+
+    Args:
+        results (Dict[str, Dict[str, float]]): The new measurements.
+        baseline (Dict[str, Dict[str, float]]): The stored measurements.
+        tolerance (float): The allowed relative growth, e.g. 0.5 for 50%.
+
+    Returns:
+        List[str]: A description of each regression.
+    """
+    regressions = []
+    for name, metrics in results.items():
+        floors = {
+            "seconds": MIN_IMPORT_SECONDS
+            if name.startswith("import ")
+            else MIN_SECONDS,
+            "peak_bytes": MIN_BYTES,
+        }
+        for metric, value in metrics.items():
+            old = baseline.get(name, {}).get(metric)
+            if old is None or value - old <= floors[metric]:
+                continue
+            if value > old * (1 + tolerance):
+                regressions.append(
+                    f"{name} {metric}: {value:.6g} vs baseline {old:.6g}"
+                )
+    return regressions
+
+
+def find_speedups(
+    results: Dict[str, Dict[str, float]],
+) -> List[Tuple[str, str, float]]:
+    """
+    Compare each batch form in SPEEDUPS with its scalar loop.
+
+    Sizes measured for only one of the two benchmarks are skipped.
+
+    Args:
+        results (Dict[str, Dict[str, float]]): The measurements.
+
+    Returns:
+        List[Tuple[str, str, float]]: For each size, the names of the batch
+        and loop measurements and how many times faster the batch form was.
+    """
+    speedups = []
+    for batch, loop in SPEEDUPS:
+        for name, metrics in results.items():
+            if not name.startswith(f"{batch}["):
+                continue
+            loop_name = loop + name[len(batch) :]
+            if loop_name in results:
+                speedup = results[loop_name]["seconds"] / metrics["seconds"]
+                speedups.append((name, loop_name, speedup))
+    return speedups
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run the benchmarks from the command line.
+
+    Returns:
+        int: 1 if a regression was found or a batch form was not faster than
+        its scalar loop, 0 otherwise.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--quick", action="store_true", help="smaller sizes only")
+    parser.add_argument("--save", action="store_true", help="store a new baseline")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="baseline file")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help="allowed relative growth before flagging a regression",
+    )
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(quick=args.quick)
+    for name, metrics in results.items():
+        line = f"{name:50} {metrics['seconds'] * 1000:12.4f} ms"
+        if "peak_bytes" in metrics:
+            line += f" {metrics['peak_bytes'] / 1024:12.1f} KiB"
+        print(line)
+
+    regressions = []
+    for batch, loop, speedup in find_speedups(results):
+        print(f"{batch} is {speedup:.2f}x as fast as {loop}")
+        if speedup <= 1:
+            regressions.append(f"{batch} is not faster than {loop}")
+
+    if args.save:
+        with open(args.baseline, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2, sort_keys=True)
+            file.write("\n")
+        print(f"Saved baseline to {args.baseline}")
+    elif not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --save to create one.")
+    else:
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)
+        regressions += find_regressions(results, baseline, args.tolerance)
+
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
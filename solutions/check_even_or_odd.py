@@ -1,3 +1,15 @@
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+# Only needed by type checkers; the annotations are never evaluated.
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    import numpy as np
+
+
 def check_even_or_odd(number):
     """
     Check if a given number is even or odd.
@@ -11,6 +23,41 @@ def check_even_or_odd(number):
     return "Even" if number % 2 == 0 else "Odd"
 
 
+def check_even_or_odd_batch(
+    numbers: Iterable[int],
+) -> list[bool] | np.ndarray:
+    """
+    Check a whole batch of integers at once.
+
+    A NumPy array is validated once by its dtype and tested with a single
+    vectorized operation. Any other iterable is validated in the same pass
+    that tests it, since & raises TypeError for floats, strings and other
+    non-integers.
+
+    Args:
+        numbers (Iterable[int]): The integers to check.
+
+    Returns:
+        list[bool] | np.ndarray: A parity mask, True where the number
+        is even and False where it is odd. It is a boolean NumPy array if
+        numbers is a NumPy array, and a list otherwise.
+
+    Raises:
+        TypeError: If the numbers are not all integers.
+    """
+    # numbers can only be a NumPy array if NumPy has already been imported.
+    np = sys.modules.get("numpy")
+    if np is not None and isinstance(numbers, np.ndarray):
+        if numbers.dtype.kind not in "biu":
+            raise TypeError("numbers must be integers.")
+        return (numbers & 1) == 0
+
+    try:
+        return [not number & 1 for number in numbers]
+    except TypeError:
+        raise TypeError("numbers must be integers.") from None
+
+
 def run_tests():
     """
     Run test cases for the check_even_or_odd function.
@@ -23,6 +70,10 @@ def run_tests():
         assert result == expected_results[idx], f"Test failed for input {test}"
         print(f"Test passed for input {test}: {result}")
 
+    mask = check_even_or_odd_batch(test_cases)
+    assert mask == [result == "Even" for result in expected_results]
+    print(f"Test passed for batch {test_cases}: {mask}")
+
 
 if __name__ == "__main__":
     run_tests()
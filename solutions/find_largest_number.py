@@ -1,26 +1,318 @@
 """
 This module provides a function to find the largest number in a list of integers.
+
+It also provides summarize_numbers, which reduces lists, any other iterables,
+NumPy arrays and binary files of packed numbers in fixed-size chunks. In one
+pass it can report the position of the largest number, the smallest number
+and the k largest numbers. NumPy is optional: without it, files are read with
+the array module and reduced in pure Python. It is only imported to memory-map
+a file, so importing this module does not load it.
 """
 
-from typing import List
+import heapq
+import os
+import sys
+from array import array
+from dataclasses import dataclass
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, List, Optional, Union
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Number of items reduced at a time.
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+# NumPy arrays at least this long are split across threads. NumPy releases
+# the GIL while reducing, so the threads run in parallel.
+PARALLEL_THRESHOLD = 4 * DEFAULT_CHUNK_SIZE
+
+
+@dataclass
+class NumberSummary:
+    """
+    The result of summarize_numbers.
+
+    - largest and largest_index give the largest number and the position of
+      its first occurrence.
+    - smallest and smallest_index are only set when with_min is requested.
+    - top_k holds the k largest numbers in descending order when top_k is
+      requested.
+    """
+
+    largest: Any
+    largest_index: int
+    smallest: Any = None
+    smallest_index: Optional[int] = None
+    top_k: Optional[List[Any]] = None
 
 
-def find_largest_number(numbers: List[int]) -> int:
+def find_largest_number(
+    numbers: Union[Iterable[int], os.PathLike], typecode: str = "q"
+) -> int:
     """
     Returns the largest number in a list.
 
+    Lists and tuples are reduced directly with max(). Any other iterable,
+    NumPy array or binary file is reduced in chunks by summarize_numbers.
+
     Args:
-        numbers (List[int]): A non-empty list of integers.
+        numbers (Union[Iterable[int], os.PathLike]): A non-empty list of
+            integers, or any other source accepted by summarize_numbers.
+        typecode (str): The array typecode of the items of a binary file.
 
     Returns:
         int: The largest number in the list.
 
     Raises:
+        TypeError: If numbers is a str or bytes; pass file paths as
+            os.PathLike objects such as pathlib.Path.
         ValueError: If the list is empty.
     """
-    if not numbers:
+    if isinstance(numbers, (list, tuple)):
+        if not numbers:
+            raise ValueError("The list cannot be empty.")
+        return max(numbers)
+    return summarize_numbers(numbers, typecode=typecode).largest
+
+
+def summarize_numbers(
+    numbers: Union[Iterable[int], os.PathLike],
+    top_k: int = 0,
+    with_min: bool = False,
+    typecode: str = "q",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    workers: Optional[int] = None,
+) -> NumberSummary:
+    """
+    Find the largest number, its position and optionally more in one pass.
+
+    The input is reduced chunk by chunk, so only one chunk (plus the k
+    largest numbers seen so far) is held in memory at a time:
+
+    - An os.PathLike object, such as a pathlib.Path, names a binary file of
+      packed numbers, which is memory-mapped with NumPy when it is
+      installed, or read in blocks otherwise. Either way the file is
+      scanned once, from start to end. Plain strings are rejected rather
+      than iterated character by character.
+    - A NumPy array is reduced in views of chunk_size items. Arrays of at
+      least PARALLEL_THRESHOLD items are split into one part per worker
+      thread and the partial results are combined.
+    - Any other iterable, including generators, is consumed chunk_size items
+      at a time.
+
+    The k largest numbers of each chunk are found with np.partition or
+    heapq.nlargest and merged into a bounded list of k candidates.
+
+    NaN is not supported. NumPy reductions return the first NaN, while
+    max(), min() and heapq skip or keep a NaN depending on where it is, so
+    a NumPy array and a list of the same floats can give different results.
+    Drop NaNs before summarizing, e.g. numbers[~np.isnan(numbers)].
+
+    Args:
+        numbers (Union[Iterable[int], os.PathLike]): The numbers to reduce.
+        top_k (int): How many of the largest numbers to return (0 for none).
+        with_min (bool): If True, also find the smallest number.
+        typecode (str): The array typecode (e.g. "q" for int64, "d" for
+            float64) of the items of a binary file.
+        chunk_size (int): The number of items reduced at a time.
+        workers (Optional[int]): The number of threads for large NumPy
+            arrays. Defaults to the number of CPUs; 1 disables threading.
+
+    Returns:
+        NumberSummary: The largest number and its index, and the requested
+        extras.
+
+    Raises:
+        TypeError: If numbers is a str or bytes.
+        ValueError: If there are no numbers, top_k is negative, chunk_size
+            is not positive, or a binary file is truncated.
+
+    Examples:
+        >>> summary = summarize_numbers([3, 9, 1, 9, 4], top_k=3, with_min=True)
+        >>> summary.largest, summary.largest_index, summary.top_k
+        (9, 1, [9, 9, 4])
+        >>> summary.smallest, summary.smallest_index
+        (1, 2)
+    """
+    if isinstance(numbers, (str, bytes)):
+        raise TypeError("File paths must be os.PathLike objects, e.g. pathlib.Path.")
+    if not isinstance(top_k, int) or top_k < 0:
+        raise ValueError("top_k must be a non-negative integer.")
+    if not isinstance(chunk_size, int) or chunk_size <= 0:
+        raise ValueError("chunk_size must be a positive integer.")
+
+    if isinstance(numbers, os.PathLike):
+        try:
+            numbers = _memory_map(numbers, typecode)
+            workers = 1
+        except ImportError:
+            chunks = _file_chunks(numbers, typecode, chunk_size)
+            return _reduce_chunks(chunks, 0, top_k, with_min)
+
+    # An input can only be a NumPy array if NumPy has already been imported.
+    np = sys.modules.get("numpy")
+    if np is not None and isinstance(numbers, np.ndarray):
+        return _summarize_array(numbers.ravel(), top_k, with_min, chunk_size, workers)
+
+    return _reduce_chunks(_iterable_chunks(numbers, chunk_size), 0, top_k, with_min)
+
+
+def _memory_map(path: os.PathLike, typecode: str) -> "np.ndarray":
+    """
+    Memory-map a binary file of packed numbers as a read-only NumPy array.
+
+    Raises ImportError if NumPy is not installed.
+    """
+    import numpy as np
+
+    dtype = np.dtype(typecode)
+    size = os.path.getsize(path)
+    if size % dtype.itemsize:
+        raise ValueError(
+            f"{os.fspath(path)} is not a whole number of {dtype.itemsize}-byte items."
+        )
+    if size == 0:
+        return np.empty(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode="r")
+
+
+def _file_chunks(path: os.PathLike, typecode: str, chunk_size: int) -> Iterator[array]:
+    """
+    Read a binary file of packed numbers in arrays of chunk_size items.
+    """
+    itemsize = array(typecode).itemsize
+    with open(path, "rb", buffering=0) as file:
+        while block := file.read(chunk_size * itemsize):
+            if len(block) % itemsize:
+                raise ValueError(
+                    f"{os.fspath(path)} is not a whole number of {itemsize}-byte items."
+                )
+            yield array(typecode, block)
+
+
+def _iterable_chunks(numbers: Iterable, chunk_size: int) -> Iterator[list]:
+    """
+    Split any iterable into lists of at most chunk_size items.
+    """
+    iterator = iter(numbers)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
+
+
+def _summarize_array(
+    numbers: "np.ndarray",
+    top_k: int,
+    with_min: bool,
+    chunk_size: int,
+    workers: Optional[int],
+) -> NumberSummary:
+    """
+    Reduce a 1-D NumPy array, splitting large ones across threads.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1 or len(numbers) < PARALLEL_THRESHOLD:
+        chunks = _array_chunks(numbers, 0, len(numbers), chunk_size)
+        return _reduce_chunks(chunks, 0, top_k, with_min)
+
+    bounds = [len(numbers) * part // workers for part in range(workers + 1)]
+
+    def reduce_part(part: int) -> NumberSummary:
+        start, stop = bounds[part], bounds[part + 1]
+        chunks = _array_chunks(numbers, start, stop, chunk_size)
+        return _reduce_chunks(chunks, start, top_k, with_min)
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        partials = list(executor.map(reduce_part, range(workers)))
+
+    summary = partials[0]
+    for partial in partials[1:]:
+        summary = _combine(summary, partial, top_k, with_min)
+    return summary
+
+
+def _array_chunks(
+    numbers: "np.ndarray", start: int, stop: int, chunk_size: int
+) -> Iterator["np.ndarray"]:
+    """
+    Yield views of numbers[start:stop] of at most chunk_size items.
+    """
+    for offset in range(start, stop, chunk_size):
+        yield numbers[offset : min(offset + chunk_size, stop)]
+
+
+def _reduce_chunks(
+    chunks: Iterable, offset: int, top_k: int, with_min: bool
+) -> NumberSummary:
+    """
+    Reduce consecutive chunks, the first starting at index offset.
+    """
+    summary = None
+    for chunk in chunks:
+        partial = _summarize_chunk(chunk, offset, top_k, with_min)
+        offset += len(chunk)
+        summary = (
+            partial if summary is None else _combine(summary, partial, top_k, with_min)
+        )
+    if summary is None:
         raise ValueError("The list cannot be empty.")
-    return max(numbers)
+    return summary
+
+
+def _summarize_chunk(
+    chunk: Any, offset: int, top_k: int, with_min: bool
+) -> NumberSummary:
+    """
+    Reduce one chunk (a list, an array.array or a NumPy array).
+    """
+    np = sys.modules.get("numpy")
+    if np is not None and isinstance(chunk, np.ndarray):
+        index = int(np.argmax(chunk))
+        summary = NumberSummary(chunk[index].item(), offset + index)
+        if with_min:
+            index = int(np.argmin(chunk))
+            summary.smallest = chunk[index].item()
+            summary.smallest_index = offset + index
+        if top_k:
+            if len(chunk) > top_k:
+                chunk = np.partition(chunk, len(chunk) - top_k)[-top_k:]
+            summary.top_k = sorted(chunk.tolist(), reverse=True)
+        return summary
+
+    largest = max(chunk)
+    summary = NumberSummary(largest, offset + chunk.index(largest))
+    if with_min:
+        summary.smallest = min(chunk)
+        summary.smallest_index = offset + chunk.index(summary.smallest)
+    if top_k:
+        summary.top_k = heapq.nlargest(top_k, chunk)
+    return summary
+
+
+def _combine(
+    first: NumberSummary, second: NumberSummary, top_k: int, with_min: bool
+) -> NumberSummary:
+    """
+    Combine the summaries of two consecutive parts of the input.
+
+    On ties the earlier index (from first) wins.
+    """
+    if second.largest > first.largest:
+        summary = NumberSummary(second.largest, second.largest_index)
+    else:
+        summary = NumberSummary(first.largest, first.largest_index)
+    if with_min:
+        summary.smallest, summary.smallest_index = (
+            (second.smallest, second.smallest_index)
+            if second.smallest < first.smallest
+            else (first.smallest, first.smallest_index)
+        )
+    if top_k:
+        summary.top_k = heapq.nlargest(top_k, first.top_k + second.top_k)
+    return summary
 
 
 if __name__ == "__main__":
@@ -5,11 +5,24 @@ A module for finding the maximum of two numbers.
 
 Module contents:
     - find_max_number
+    - find_the_maximum_of_two_numbers_batch
 
 Created on 2025-01-06
 @author: Ajanduna Emmanuel
 """
 
+from __future__ import annotations
+
+import sys
+from operator import index
+
+TYPE_CHECKING = False
+# Only needed by type checkers; the annotations are never evaluated.
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import numpy as np
+
 
 def find_the_maximum_of_two_numbers(num1: int, num2: int) -> int:
     """
@@ -41,5 +54,59 @@ def find_the_maximum_of_two_numbers(num1: int, num2: int) -> int:
     return num1 if num1 > num2 else num2
 
 
+def find_the_maximum_of_two_numbers_batch(
+    nums1: Sequence[int], nums2: Sequence[int]
+) -> list[int] | np.ndarray:
+    """
+    This function takes two sequences of numbers and returns the greater value
+    at each position.
+
+    NumPy arrays are validated once by their dtype. Other sequences are
+    validated in the same pass that computes the maximum: each item goes
+    through operator.index, which accepts ints and rejects anything else.
+
+    Args:
+        nums1 (Sequence[int]): The first numbers.
+        nums2 (Sequence[int]): The second numbers, as many as nums1.
+
+    Returns:
+        list[int] | np.ndarray: The element-wise maximum, as a NumPy
+        array if either input is a NumPy array and as a list otherwise.
+
+    Raises:
+        AssertionError: If either input does not hold only ints, the inputs
+        have different lengths, or NumPy arrays mix signed integers with
+        uint64.
+
+    Examples:
+        >>> find_the_maximum_of_two_numbers_batch([2, 0, 1], [4, -2, 9])
+        [4, 0, 9]
+    """
+    assert len(nums1) == len(nums2), "nums1 and nums2 must have the same length"
+
+    # The inputs can only be NumPy arrays if NumPy has already been imported.
+    np = sys.modules.get("numpy")
+    if np is not None and (
+        isinstance(nums1, np.ndarray) or isinstance(nums2, np.ndarray)
+    ):
+        nums1, nums2 = np.asarray(nums1), np.asarray(nums2)
+        assert nums1.dtype.kind in "biu", "nums1 must hold integers"
+        assert nums2.dtype.kind in "biu", "nums2 must hold integers"
+        # Signed integers and uint64 have no common integer type: NumPy would
+        # promote them to float64.
+        assert np.result_type(nums1, nums2).kind in "biu", (
+            "nums1 and nums2 must not mix signed integers with uint64"
+        )
+        return np.maximum(nums1, nums2)
+
+    try:
+        return [
+            num1 if num1 > num2 else num2
+            for num1, num2 in zip(map(index, nums1), map(index, nums2))
+        ]
+    except TypeError:
+        raise AssertionError("nums1 and nums2 must hold integers") from None
+
+
 if __name__ == "__main__":
     print(find_the_maximum_of_two_numbers(0, 9))
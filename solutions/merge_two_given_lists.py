@@ -5,6 +5,9 @@ A module for merging two lists of items.
 
 Module contents:
     -merge two lists
+    -MergedListView: a read-only, zero-copy view over several lists
+    -merge_sorted: a streaming k-way merge of sorted iterables
+    -merge_list_files: an out-of-core merge of lists stored in files
 
 Created on 2025-01-08
 @author: Ajanduna Emmanuel
@@ -12,25 +15,269 @@ Created on 2025-01-08
 
 # write a function that merging two lists of items
 
-from typing import List, Union
+import heapq
+import os
+import sys
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterable, Sequence
+from typing import Any, Callable, Iterator, List, Optional, Tuple, Union
+
+# Defaults for merge_list_files: bytes buffered per open file, and the
+# memory budget for sorting runs and for the files open during a merge.
+DEFAULT_BUFFER_SIZE = 1024 * 1024
+DEFAULT_MAX_MEMORY = 64 * 1024 * 1024
+
+# What an open reader holds on top of its byte buffer: the file object, the
+# generator and its entry in the merge heap. A text reader also decodes 8 KiB
+# chunks, and a decoded chunk takes up to 4 bytes per character.
+_READER_OVERHEAD = 4 * 1024
+_TEXT_READER_OVERHEAD = 5 * 8 * 1024
+
+
+class MergedListView(Sequence):
+    """
+    A read-only view of several sequences joined end to end.
+
+    Nothing is copied: the view keeps references to the original sequences
+    and a prefix-offset index of where each one starts, so building it costs
+    O(k) for k sequences whatever their lengths. Indexing finds the right
+    sequence with a binary search over the offsets (O(log k)), slicing
+    returns another view, and iteration walks the sequences in turn. A new
+    list is only built by to_list().
+
+    Since the originals are referenced, not copied, changing their lengths
+    after the view is built leaves the view in an undefined state.
+
+    Examples:
+        >>> view = MergedListView([1, 2, 3], [4, 5], [6])
+        >>> len(view), view[3], view[-1]
+        (6, 4, 6)
+        >>> view[1:5].to_list()
+        [2, 3, 4, 5]
+        >>> list(view[::-2])
+        [6, 4, 2]
+    """
+
+    def __init__(self, *sequences: Sequence):
+        """
+        Build a view over the given sequences, in order.
+
+        Args:
+            *sequences (Sequence): The sequences to join.
+
+        Raises:
+            TypeError: If any argument is not a sequence.
+        """
+        segments = []
+        for sequence in sequences:
+            if not isinstance(sequence, Sequence):
+                raise TypeError("All arguments must be sequences.")
+            segments.append((sequence, range(len(sequence))))
+        self._set_segments(segments)
+
+    def _set_segments(self, segments: List[Tuple[Sequence, range]]) -> None:
+        """
+        Store the (sequence, index range) segments and their start offsets.
+        """
+        self._segments = [segment for segment in segments if len(segment[1])]
+        self._offsets = []
+        length = 0
+        for _, indices in self._segments:
+            self._offsets.append(length)
+            length += len(indices)
+        self._length = length
+
+    @classmethod
+    def _from_segments(cls, segments: List[Tuple[Sequence, range]]) -> "MergedListView":
+        """
+        Build a view directly from (sequence, index range) segments.
+        """
+        view = cls.__new__(cls)
+        view._set_segments(segments)
+        return view
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._slice(range(self._length)[index])
+        if not isinstance(index, int):
+            raise TypeError("MergedListView indices must be integers or slices.")
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("MergedListView index out of range")
+        position = bisect_right(self._offsets, index) - 1
+        sequence, indices = self._segments[position]
+        return sequence[indices[index - self._offsets[position]]]
+
+    def _slice(self, selected: range) -> "MergedListView":
+        """
+        Return a view of the positions in `selected`, in that order.
+
+        Each segment keeps the part of `selected` that falls inside it,
+        translated into an index range of its own sequence.
+        """
+        step = selected.step
+        order = range(len(self._segments))
+        if step < 0:
+            order = reversed(order)
+
+        segments = []
+        for position in order:
+            sequence, indices = self._segments[position]
+            start = self._offsets[position]
+            stop = start + len(indices)
+            if step > 0:
+                first = max(0, -(-(start - selected.start) // step))
+                last = max(0, -(-(stop - selected.start) // step))
+            else:
+                first = max(0, -(-(selected.start - stop + 1) // -step))
+                last = max(0, (selected.start - start) // -step + 1)
+            part = selected[first:last]
+            if not part:
+                continue
+            local_start = part.start - start
+            local_stop = local_start + len(part) * step
+            segments.append(
+                (
+                    sequence,
+                    range(
+                        indices.start + local_start * indices.step,
+                        indices.start + local_stop * indices.step,
+                        step * indices.step,
+                    ),
+                )
+            )
+        return self._from_segments(segments)
+
+    def __iter__(self) -> Iterator:
+        for sequence, indices in self._segments:
+            yield from map(sequence.__getitem__, indices)
+
+    def __reversed__(self) -> Iterator:
+        for sequence, indices in reversed(self._segments):
+            yield from map(sequence.__getitem__, reversed(indices))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_list()!r})"
+
+    def to_list(self) -> list:
+        """
+        Copy the elements of the view into a new list.
+
+        Returns:
+            list: The elements of the view, in order.
+        """
+        return list(self)
+
+
+def _check_iterables(iterables: Tuple[Any, ...]) -> None:
+    """
+    Raise TypeError unless every argument is a non-string iterable.
+    """
+    for iterable in iterables:
+        if not isinstance(iterable, Iterable) or isinstance(
+            iterable, (str, bytes, bytearray)
+        ):
+            raise TypeError("All arguments must be iterables of items.")
+
+
+def merge_sorted(
+    *iterables: Iterable,
+    key: Optional[Callable[[Any], Any]] = None,
+    dedup: bool = False,
+) -> Iterator:
+    """
+    Lazily merge already sorted iterables into one sorted stream.
+
+    The inputs can be any iterables, including generators, and are consumed
+    one item at a time. A heap holds the current head of each input, so
+    merging N items from k inputs takes O(N log k) time and O(k) memory.
+    Equal items keep the order of the inputs they came from.
+
+    Args:
+        *iterables (Iterable): The sorted iterables to merge.
+        key (Optional[Callable[[Any], Any]]): A function giving the sort key
+            of each item, as for sorted(). Defaults to the items themselves.
+        dedup (bool): If True, yield only the first of each run of items with
+            equal keys, giving the sorted union of the inputs.
+
+    Returns:
+        Iterator: An iterator over the merged items.
+
+    Raises:
+        TypeError: If any argument is not an iterable (strings are rejected).
+
+    Examples:
+        >>> list(merge_sorted([1, 4, 7], [2, 5], (n for n in [3, 4, 6])))
+        [1, 2, 3, 4, 4, 5, 6, 7]
+
+        >>> list(merge_sorted([1, 2, 3], [2, 3, 4], dedup=True))
+        [1, 2, 3, 4]
+
+        >>> list(merge_sorted(['b', 'C'], ['A', 'd'], key=str.lower))
+        ['A', 'b', 'C', 'd']
+    """
+    _check_iterables(iterables)
+    merged = heapq.merge(*iterables, key=key)
+    if not dedup:
+        return merged
+    return _skip_duplicates(merged, key)
+
+
+def _skip_duplicates(items: Iterator, key: Optional[Callable[[Any], Any]]) -> Iterator:
+    """
+    Yield the first item of each run of consecutive items with equal keys.
+    """
+    previous = sentinel = object()
+    for item in items:
+        current = item if key is None else key(item)
+        if previous is sentinel or current != previous:
+            yield item
+        previous = current
 
 
 def merge_two_given_lists(
-    list1: List[Union[int, str]], list2: List[Union[int, str]]
-) -> List[Union[int, str]]:
+    list1: Union[List[Union[int, str]], Iterable[Union[int, str]]],
+    list2: Union[List[Union[int, str]], Iterable[Union[int, str]]],
+    lazy: bool = False,
+    sorted_merge: bool = False,
+    key: Optional[Callable[[Any], Any]] = None,
+    dedup: bool = False,
+) -> Union[List[Union[int, str]], MergedListView, Iterator]:
     """
     Merge two lists into one.
 
     Args:
-        list1 (List[Union[int, str]]): The first list to merge.
-        list2 (List[Union[int, str]]): The second list to merge.
+        list1 (Union[List[Union[int, str]], Iterable[Union[int, str]]]): The
+            first list to merge. With sorted_merge, any sorted iterable.
+        list2 (Union[List[Union[int, str]], Iterable[Union[int, str]]]): The
+            second list to merge. With sorted_merge, any sorted iterable.
+        lazy (bool): If True, return a read-only MergedListView over both
+            lists instead of copying them into a new list.
+        sorted_merge (bool): If True, treat both arguments as already sorted
+            iterables and return an iterator over their sorted merge (see
+            merge_sorted) instead of their concatenation. The result is
+            always lazy, so this cannot be combined with lazy.
+        key (Optional[Callable[[Any], Any]]): The sort key. Only allowed
+            with sorted_merge.
+        dedup (bool): If True, drop duplicates from the output. Only allowed
+            with sorted_merge.
 
     Returns:
-        List[Union[int, str]]: A new list containing all elements from
-        list1 followed by all elements from list2.
+        Union[List[Union[int, str]], MergedListView, Iterator]: A new list
+        (or, when lazy is True, a view) containing all elements from list1
+        followed by all elements from list2, or with sorted_merge an iterator
+        over both inputs in sorted order.
 
     Raises:
-        TypeError: If either of the arguments is not a list.
+        TypeError: If either of the arguments is not a list, or with
+        sorted_merge not an iterable.
+        ValueError: If both lazy and sorted_merge are set, or key or dedup
+        is set without sorted_merge.
 
     Examples:
         >>> merge_two_given_lists([1, 2, 3], [4, 5, 6])
@@ -41,8 +288,305 @@ def merge_two_given_lists(
 
         >>> merge_two_given_lists([], [1, 2, 3])
         [1, 2, 3]
+
+        >>> merge_two_given_lists([1, 2], [3], lazy=True)
+        MergedListView([1, 2, 3])
+
+        >>> list(merge_two_given_lists([1, 3, 5], [2, 3], sorted_merge=True))
+        [1, 2, 3, 3, 5]
     """
+    if sorted_merge:
+        if lazy:
+            raise ValueError("lazy and sorted_merge cannot be used together.")
+        return merge_sorted(list1, list2, key=key, dedup=dedup)
+    if key is not None or dedup:
+        raise ValueError("key and dedup can only be used with sorted_merge.")
+
     if not isinstance(list1, list) or not isinstance(list2, list):
         raise TypeError("Both arguments must be lists.")
 
+    if lazy:
+        return MergedListView(list1, list2)
     return list1 + list2
+
+
+def _read_list_file(
+    path: Union[str, os.PathLike], typecode: Optional[str], buffer_size: int
+) -> Iterator:
+    """
+    Yield the items of a list file, reading it in blocks of buffer_size bytes.
+
+    Text files hold one item per line (yielded without the newline), binary
+    files hold packed array items of the given typecode.
+    """
+    if typecode is None:
+        with open(path, encoding="utf-8", buffering=buffer_size) as file:
+            for line in file:
+                yield line.removesuffix("\n")
+        return
+
+    # Blocks are read straight into one reused array, so a reader holds a
+    # single buffer of about buffer_size bytes.
+    block = array(typecode, [0])
+    itemsize = block.itemsize
+    block *= max(1, buffer_size // itemsize)
+    with open(path, "rb", buffering=0) as file:
+        while True:
+            with memoryview(block) as view, view.cast("B") as target:
+                filled = 0
+                while filled < len(target):
+                    with target[filled:] as rest:
+                        count = file.readinto(rest)
+                    if not count:
+                        break
+                    filled += count
+                at_end = filled < len(target)
+            if filled % itemsize:
+                raise ValueError(
+                    f"{os.fspath(path)} is not a whole number of {itemsize}-byte items."
+                )
+            if at_end:
+                del block[filled // itemsize :]
+            yield from block
+            if at_end:
+                return
+
+
+def _write_list_file(
+    path: Union[str, os.PathLike],
+    items: Iterable,
+    typecode: Optional[str],
+    buffer_size: int,
+) -> None:
+    """
+    Write items to a list file in the format read by _read_list_file.
+    """
+    if typecode is None:
+        with open(path, "w", encoding="utf-8", buffering=buffer_size) as file:
+            file.writelines(f"{item}\n" for item in items)
+        return
+
+    block = array(typecode)
+    block_items = max(1, buffer_size // block.itemsize)
+    with open(path, "wb", buffering=0) as file:
+        for item in items:
+            block.append(item)
+            if len(block) == block_items:
+                block.tofile(file)
+                del block[:]
+        block.tofile(file)
+
+
+def _concatenate_list_files(
+    input_paths: Sequence,
+    output_path: Union[str, os.PathLike],
+    typecode: Optional[str],
+    buffer_size: int,
+) -> None:
+    """
+    Copy the input files one after the other into the output file.
+
+    Text inputs that do not end with a newline get one, so that their last
+    item is not joined to the first item of the next file.
+    """
+    with open(output_path, "wb") as output:
+        for path in input_paths:
+            last = b"\n"
+            with open(path, "rb") as file:
+                while block := file.read(buffer_size):
+                    output.write(block)
+                    last = block[-1:]
+            if typecode is None and last != b"\n":
+                output.write(b"\n")
+
+
+def _temporary_path(directory: str) -> str:
+    """
+    Create an empty temporary file in directory and return its path.
+    """
+    import tempfile
+
+    handle, path = tempfile.mkstemp(dir=directory)
+    os.close(handle)
+    return path
+
+
+def _spill_sorted_runs(
+    path: Union[str, os.PathLike],
+    directory: str,
+    typecode: Optional[str],
+    key: Optional[Callable[[Any], Any]],
+    run_memory: int,
+    buffer_size: int,
+) -> Iterator[str]:
+    """
+    Sort an input file in runs that fit in run_memory bytes.
+
+    Each run is written to a temporary file in directory and its path is
+    yielded. An item costs its own size plus a list slot and room for the
+    sort, and twice that with a key, since sorting then keeps one key per
+    item.
+    """
+    run: list = []
+    used = 0
+    scale = 1 if key is None else 2
+    items = _read_list_file(path, typecode, buffer_size)
+    while True:
+        item = next(items, None)
+        if item is not None:
+            run.append(item)
+            used += (sys.getsizeof(item) + 16) * scale
+        if run and (item is None or used >= run_memory):
+            run.sort(key=key)
+            run_path = _temporary_path(directory)
+            _write_list_file(run_path, run, typecode, buffer_size)
+            yield run_path
+            run, used = [], 0
+        if item is None:
+            return
+
+
+def merge_list_files(
+    input_paths: Sequence[Union[str, os.PathLike]],
+    output_path: Union[str, os.PathLike],
+    sorted_merge: bool = False,
+    presorted: bool = True,
+    key: Optional[Callable[[Any], Any]] = None,
+    dedup: bool = False,
+    typecode: Optional[str] = None,
+    max_memory: int = DEFAULT_MAX_MEMORY,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+    temp_dir: Optional[Union[str, os.PathLike]] = None,
+) -> None:
+    """
+    Merge lists stored in files that may be too large to load into memory.
+
+    Each input is streamed through a buffered reader in blocks of
+    buffer_size bytes and the result is written to output_path in the same
+    format. Without sorted_merge the files are concatenated. With
+    sorted_merge their items are merged in sorted order with merge_sorted;
+    inputs that are not already sorted (presorted=False) are first split
+    into sorted runs of at most max_memory / 2 bytes, spilled to temporary
+    files, then merged. When there are more runs than max_memory allows
+    open at once, they are merged in several passes, so peak memory depends
+    on max_memory and buffer_size, not on the size of the inputs.
+
+    Args:
+        input_paths (Sequence[Union[str, os.PathLike]]): The files to merge.
+        output_path (Union[str, os.PathLike]): The file to write, which must
+            not be one of the inputs (checked with os.path.samefile, so
+            links to an input are caught too).
+        sorted_merge (bool): If True, merge the items in sorted order instead
+            of concatenating the files.
+        presorted (bool): Whether each input is already sorted. Only used
+            with sorted_merge.
+        key (Optional[Callable[[Any], Any]]): The sort key, as for sorted().
+            Text items are strings, so use e.g. key=int for numbers.
+        dedup (bool): If True, drop duplicates from a sorted merge.
+        typecode (Optional[str]): None for newline-delimited UTF-8 text
+            files, or an array typecode (e.g. "q" for int64, "d" for
+            float64) for binary files of packed items.
+        max_memory (int): The memory budget in bytes, at least five times
+            buffer_size (plus 8 KiB, and 80 KiB more for text files).
+        buffer_size (int): The size in bytes of each file buffer.
+        temp_dir (Optional[Union[str, os.PathLike]]): The directory in which
+            sorted runs and intermediate merges are spilled. Defaults to the
+            system temporary directory, which is often held in RAM (tmpfs),
+            so point it at a disk with room for a copy of the inputs.
+
+    Raises:
+        TypeError: If input_paths is not a sequence of paths.
+        ValueError: If output_path is one of the inputs, the sizes are not
+            positive, max_memory is too small for buffer_size, typecode is
+            unknown, or a binary file is truncated.
+
+    Examples:
+        >>> import pathlib, shutil, tempfile
+        >>> directory = pathlib.Path(tempfile.mkdtemp())
+        >>> _ = (directory / "a.txt").write_text("3\\n1\\n2\\n")
+        >>> _ = (directory / "b.txt").write_text("5\\n4\\n")
+        >>> merge_list_files(
+        ...     [directory / "a.txt", directory / "b.txt"],
+        ...     directory / "out.txt",
+        ...     sorted_merge=True,
+        ...     presorted=False,
+        ...     key=int,
+        ... )
+        >>> (directory / "out.txt").read_text().split()
+        ['1', '2', '3', '4', '5']
+        >>> shutil.rmtree(directory)
+    """
+    if isinstance(input_paths, (str, bytes)) or not isinstance(input_paths, Sequence):
+        raise TypeError("input_paths must be a sequence of paths.")
+    for path in input_paths:
+        if not isinstance(path, (str, os.PathLike)):
+            raise TypeError("input_paths must be a sequence of paths.")
+    # The output is truncated before the inputs are read, so writing to an
+    # input would destroy it.
+    if os.path.exists(output_path):
+        for path in input_paths:
+            if os.path.samefile(path, output_path):
+                raise ValueError(
+                    f"output_path {os.fspath(output_path)} is one of the inputs."
+                )
+    for name, value in (("max_memory", max_memory), ("buffer_size", buffer_size)):
+        if not isinstance(value, int) or value <= 0:
+            raise ValueError(f"{name} must be a positive integer.")
+    if typecode is not None:
+        array(typecode)
+
+    # Each open input holds one reader. One buffer is kept for the output
+    # file and two for the merge heap, the items in flight and the block
+    # being written; the rest are for the inputs. While sorting, a run
+    # shares half the budget with the reader of the input and the run file.
+    reader_memory = buffer_size + _READER_OVERHEAD
+    if typecode is None:
+        reader_memory += _TEXT_READER_OVERHEAD
+    fan_in = (max_memory - 3 * buffer_size) // reader_memory
+    if fan_in < 2:
+        raise ValueError(
+            "max_memory must hold at least two input readers and three buffers, "
+            f"{3 * buffer_size + 2 * reader_memory} bytes."
+        )
+    run_memory = max_memory // 2 - reader_memory
+
+    if not sorted_merge:
+        _concatenate_list_files(input_paths, output_path, typecode, buffer_size)
+        return
+
+    import tempfile
+
+    with tempfile.TemporaryDirectory(dir=temp_dir) as directory:
+        if presorted:
+            runs = list(input_paths)
+        else:
+            runs = [
+                run
+                for path in input_paths
+                for run in _spill_sorted_runs(
+                    path, directory, typecode, key, run_memory, buffer_size
+                )
+            ]
+
+        while len(runs) > fan_in:
+            merged_runs = []
+            for start in range(0, len(runs), fan_in):
+                group = runs[start : start + fan_in]
+                run_path = _temporary_path(directory)
+                readers = [_read_list_file(run, typecode, buffer_size) for run in group]
+                _write_list_file(
+                    run_path, merge_sorted(*readers, key=key), typecode, buffer_size
+                )
+                for run in group:
+                    if os.path.dirname(run) == directory:
+                        os.remove(run)
+                merged_runs.append(run_path)
+            runs = merged_runs
+
+        readers = [_read_list_file(run, typecode, buffer_size) for run in runs]
+        _write_list_file(
+            output_path,
+            merge_sorted(*readers, key=key, dedup=dedup),
+            typecode,
+            buffer_size,
+        )
@@ -1,3 +1,11 @@
+import importlib
+import tempfile
+import unittest
+from pathlib import Path
+
+reverse_a_string = importlib.import_module("solutions.06_reverse_a_string")
+
+
 def is_palindrome(s):
     """
     Check if the given string is a palindrome, ignoring case.
@@ -32,4 +40,168 @@ def test_is_palindrome():
         print(f"Input: '{input_str}', Expected: {expected}, Output: {result}")
 
 
-test_is_palindrome()
+class TestIsPalindrome(unittest.TestCase):
+    """
+    Run test_is_palindrome under unittest instead of at import time.
+    """
+
+    def test_is_palindrome(self):
+        """
+        Test the is_palindrome cases above.
+        """
+        test_is_palindrome()
+
+
+class TestIsPalindromeStreaming(unittest.TestCase):
+    """
+    Test cases for the is_palindrome_streaming function.
+    """
+
+    def test_matches_is_palindrome(self):
+        """
+        Test that it agrees with is_palindrome on simple strings.
+        """
+        for text in ["madam", "hello", "RaceCar", "", "A", "Noon", "Palindrome"]:
+            self.assertEqual(
+                reverse_a_string.is_palindrome_streaming(text),
+                reverse_a_string.is_palindrome(text),
+            )
+
+    def test_small_chunks(self):
+        """
+        Test palindromes whose halves span several chunks.
+        """
+        self.assertTrue(reverse_a_string.is_palindrome_streaming("abcDEfedcBA", 2))
+        self.assertFalse(reverse_a_string.is_palindrome_streaming("abcDEfgdcBA", 2))
+
+    def test_casefolding(self):
+        """
+        Test that case is ignored with Unicode casefolding.
+        """
+        self.assertTrue(reverse_a_string.is_palindrome_streaming("ßSS", 1))
+        self.assertTrue(reverse_a_string.is_palindrome_streaming("ΣaΣ"))
+
+    def test_bytes_and_buffers(self):
+        """
+        Test UTF-8 bytes, bytearrays and memoryviews.
+        """
+        data = "Été€étÉ".encode()
+        self.assertTrue(reverse_a_string.is_palindrome_streaming(data, 3))
+        self.assertTrue(reverse_a_string.is_palindrome_streaming(bytearray(data), 1))
+        self.assertTrue(reverse_a_string.is_palindrome_streaming(memoryview(data)))
+        self.assertFalse(reverse_a_string.is_palindrome_streaming(b"abca", 1))
+
+    def test_file_path(self):
+        """
+        Test reading a palindrome from a memory-mapped file.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "text.txt"
+            path.write_text("Step on no pets", encoding="utf-8")
+            self.assertTrue(reverse_a_string.is_palindrome_streaming(path, 4))
+            path.write_text("Step on no cats", encoding="utf-8")
+            self.assertFalse(reverse_a_string.is_palindrome_streaming(path, 4))
+            path.write_bytes(b"")
+            self.assertTrue(reverse_a_string.is_palindrome_streaming(path))
+
+    def test_invalid_input(self):
+        """
+        Test handling of invalid input types and chunk sizes.
+        """
+        with self.assertRaises(TypeError):
+            reverse_a_string.is_palindrome_streaming(12321)
+        with self.assertRaisesRegex(TypeError, "contiguous"):
+            reverse_a_string.is_palindrome_streaming(memoryview(b"abcba")[::2])
+        with self.assertRaises(ValueError):
+            reverse_a_string.is_palindrome_streaming("abba", 0)
+
+
+class TestPalindromeIndex(unittest.TestCase):
+    """
+    Test cases for the PalindromeIndex class.
+    """
+
+    def test_is_palindrome_ranges(self):
+        """
+        Test range queries against slicing the string.
+        """
+        text = "xRaceCarabbaNoonx"
+        index = reverse_a_string.PalindromeIndex(text)
+        for start in range(len(text) + 1):
+            for stop in range(start, len(text) + 1):
+                self.assertEqual(
+                    index.is_palindrome(start, stop),
+                    reverse_a_string.is_palindrome(text[start:stop]),
+                )
+
+    def test_case_folding_matches_is_palindrome(self):
+        """
+        Test that case is ignored with lower(), as in is_palindrome.
+        """
+        for text in ["σς", "σΑσ", "ßSS", "SSß", "Straße", "AbBa"]:
+            index = reverse_a_string.PalindromeIndex(text)
+            self.assertEqual(
+                index.is_palindrome(0, len(text)),
+                reverse_a_string.is_palindrome(text),
+                text,
+            )
+
+    def test_dotted_capital_i(self):
+        """
+        Test that "İ" is compared as one character, unlike str.lower().
+        """
+        self.assertTrue(reverse_a_string.PalindromeIndex("İ").is_palindrome(0, 1))
+        self.assertTrue(reverse_a_string.PalindromeIndex("aİA").is_palindrome(0, 3))
+        self.assertFalse(reverse_a_string.PalindromeIndex("İi").is_palindrome(0, 2))
+
+    def test_capital_sigma(self):
+        """
+        Test that capital sigma is always lowered to σ, unlike str.lower().
+        """
+        self.assertTrue(reverse_a_string.PalindromeIndex("ΣΣ").is_palindrome(0, 2))
+        self.assertTrue(reverse_a_string.PalindromeIndex("Σσ").is_palindrome(0, 2))
+        self.assertFalse(reverse_a_string.PalindromeIndex("Σς").is_palindrome(0, 2))
+
+    def test_are_palindromes(self):
+        """
+        Test a batch of range queries.
+        """
+        index = reverse_a_string.PalindromeIndex("abbaXmadam")
+        self.assertEqual(
+            index.are_palindromes([(0, 4), (1, 3), (0, 5), (5, 10), (4, 4)]),
+            [True, True, False, True, True],
+        )
+
+    def test_longest(self):
+        """
+        Test finding the longest palindromic substring.
+        """
+        self.assertEqual(
+            reverse_a_string.PalindromeIndex("xyRaceCarz").longest(), "RaceCar"
+        )
+        self.assertEqual(reverse_a_string.PalindromeIndex("abccbd").longest(), "bccb")
+        self.assertEqual(reverse_a_string.PalindromeIndex("").longest(), "")
+
+    def test_count(self):
+        """
+        Test counting palindromic substrings.
+        """
+        self.assertEqual(reverse_a_string.PalindromeIndex("aaa").count(), 6)
+        self.assertEqual(reverse_a_string.PalindromeIndex("abc").count(), 3)
+        self.assertEqual(reverse_a_string.PalindromeIndex("").count(), 0)
+
+    def test_invalid_input(self):
+        """
+        Test handling of invalid strings and ranges.
+        """
+        with self.assertRaises(TypeError):
+            reverse_a_string.PalindromeIndex(["a", "b"])
+        index = reverse_a_string.PalindromeIndex("abc")
+        with self.assertRaises(IndexError):
+            index.is_palindrome(2, 1)
+        with self.assertRaises(IndexError):
+            index.are_palindromes([(0, 4)])
+
+
+if __name__ == "__main__":
+    unittest.main()
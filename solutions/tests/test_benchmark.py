@@ -0,0 +1,142 @@
+"""
+Test module for the benchmark harness and import hygiene of solutions.
+"""
+
+import os
+import subprocess
+import sys
+import unittest
+
+from ..benchmark import (
+    SOLUTION_MODULES,
+    find_regressions,
+    find_speedups,
+    measure_call,
+)
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class TestImportHygiene(unittest.TestCase):
+    """
+    Test that importing the solutions modules has no side effects.
+    """
+
+    def test_imports_print_nothing(self):
+        """
+        Test that no module prints anything or runs its demo when imported.
+        """
+        code = (
+            "import importlib, sys\n"
+            "for name in sys.argv[1:]:\n"
+            "    importlib.import_module(name)\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code, *SOLUTION_MODULES],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        self.assertEqual(result.stdout, "")
+        self.assertEqual(result.stderr, "")
+
+    def loads(self, modules, name):
+        """
+        Return whether importing modules in a fresh interpreter loads name.
+        """
+        code = (
+            "import importlib, sys\n"
+            "for module in sys.argv[2:]:\n"
+            "    importlib.import_module(module)\n"
+            "print(sys.argv[1] in sys.modules)\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code, name, *modules],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return result.stdout == "True\n"
+
+    def test_imports_skip_numpy(self):
+        """
+        Test that NumPy is only imported when an input needs it.
+        """
+        self.assertFalse(self.loads(SOLUTION_MODULES, "numpy"))
+
+    def test_scalar_helpers_skip_typing(self):
+        """
+        Test that the scalar helper modules stay cheap to import.
+        """
+        modules = [
+            "solutions.check_even_or_odd",
+            "solutions.find_the_maximum_of_two_numbers",
+        ]
+        self.assertFalse(self.loads(modules, "typing"))
+
+
+class TestBenchmark(unittest.TestCase):
+    """
+    Test cases for the benchmark helpers.
+    """
+
+    def test_measure_call(self):
+        """
+        Test that a call is timed and its allocations are traced.
+        """
+        result = measure_call(lambda size: [0] * size, (100_000,), repeat=1)
+        self.assertGreater(result["seconds"], 0)
+        self.assertGreaterEqual(result["peak_bytes"], 100_000 * 8)
+
+    def test_find_regressions(self):
+        """
+        Test that only measurements beyond the tolerance are flagged.
+        """
+        baseline = {
+            "slow[10]": {"seconds": 0.01, "peak_bytes": 100_000},
+            "fast[10]": {"seconds": 0.01, "peak_bytes": 100_000},
+            "tiny[10]": {"seconds": 1e-7, "peak_bytes": 10},
+            "import fast": {"seconds": 0.002},
+            "import slow": {"seconds": 0.01},
+        }
+        results = {
+            "slow[10]": {"seconds": 0.02, "peak_bytes": 100_000},
+            "fast[10]": {"seconds": 0.012, "peak_bytes": 90_000},
+            "tiny[10]": {"seconds": 5e-7, "peak_bytes": 50},
+            "new[10]": {"seconds": 1.0, "peak_bytes": 10**9},
+            "import fast": {"seconds": 0.004},
+            "import slow": {"seconds": 0.02},
+        }
+        regressions = find_regressions(results, baseline, tolerance=0.5)
+        self.assertEqual(len(regressions), 2)
+        self.assertTrue(regressions[0].startswith("slow[10] seconds"))
+        self.assertTrue(regressions[1].startswith("import slow seconds"))
+
+    def test_find_speedups(self):
+        """
+        Test that batch forms are compared with their loops size by size.
+        """
+        results = {
+            "check_even_or_odd[10]": {"seconds": 0.03},
+            "check_even_or_odd_batch[10]": {"seconds": 0.01},
+            "check_even_or_odd_batch[20]": {"seconds": 0.02},
+            "find_the_maximum_of_two_numbers[10]": {"seconds": 0.01},
+            "find_the_maximum_of_two_numbers_batch[10]": {"seconds": 0.02},
+        }
+        self.assertEqual(
+            find_speedups(results),
+            [
+                ("check_even_or_odd_batch[10]", "check_even_or_odd[10]", 3.0),
+                (
+                    "find_the_maximum_of_two_numbers_batch[10]",
+                    "find_the_maximum_of_two_numbers[10]",
+                    0.5,
+                ),
+            ],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
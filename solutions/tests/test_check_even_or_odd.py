@@ -0,0 +1,62 @@
+"""
+Test module for the check_even_or_odd and check_even_or_odd_batch functions.
+"""
+
+import unittest
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy is optional
+    np = None
+
+from ..check_even_or_odd import check_even_or_odd, check_even_or_odd_batch
+
+
+class TestCheckEvenOrOdd(unittest.TestCase):
+    """
+    Test cases for the check_even_or_odd functions.
+    """
+
+    def test_scalar(self):
+        """
+        Test checking single numbers.
+        """
+        self.assertEqual(check_even_or_odd(4), "Even")
+        self.assertEqual(check_even_or_odd(-3), "Odd")
+
+    def test_batch_list(self):
+        """
+        Test the parity mask of a list and of a generator.
+        """
+        self.assertEqual(
+            check_even_or_odd_batch([4, 7, 0, -2, -3]), [True, False, True, True, False]
+        )
+        self.assertEqual(
+            check_even_or_odd_batch(n for n in range(3)), [True, False, True]
+        )
+        self.assertEqual(check_even_or_odd_batch([]), [])
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_batch_numpy_array(self):
+        """
+        Test the parity mask of a NumPy array.
+        """
+        mask = check_even_or_odd_batch(np.array([4, 7, 0, -2, -3]))
+        self.assertEqual(mask.tolist(), [True, False, True, True, False])
+        with self.assertRaises(TypeError):
+            check_even_or_odd_batch(np.array([1.0, 2.0]))
+
+    def test_batch_invalid_input(self):
+        """
+        Test that batches holding non-integers are rejected.
+        """
+        with self.assertRaises(TypeError):
+            check_even_or_odd_batch([1, 2.0])
+        with self.assertRaises(TypeError):
+            check_even_or_odd_batch(["1"])
+        with self.assertRaises(TypeError):
+            check_even_or_odd_batch(iter([2, 4, None]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+"""
+Test module for the find_largest_number and summarize_numbers functions.
+"""
+
+import tempfile
+import unittest
+from array import array
+from concurrent import futures
+from pathlib import Path
+from unittest import mock
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy is optional
+    np = None
+
+from .. import find_largest_number as find_largest_number_module
+from ..find_largest_number import find_largest_number, summarize_numbers
+
+
+class TestFindLargestNumber(unittest.TestCase):
+    """
+    Test cases for the find_largest_number function.
+    """
+
+    def test_list(self):
+        """
+        Test finding the largest number in a list.
+        """
+        self.assertEqual(find_largest_number([3, 1, 7, 0, 5]), 7)
+        self.assertEqual(find_largest_number([-10, -20, -3, -50]), -3)
+
+    def test_generator(self):
+        """
+        Test finding the largest number in a generator.
+        """
+        self.assertEqual(find_largest_number(n % 7 for n in range(100)), 6)
+
+    def test_empty_input(self):
+        """
+        Test that empty lists and iterables are rejected.
+        """
+        with self.assertRaises(ValueError):
+            find_largest_number([])
+        with self.assertRaises(ValueError):
+            find_largest_number(iter([]))
+
+
+class TestSummarizeNumbers(unittest.TestCase):
+    """
+    Test cases for the summarize_numbers function.
+    """
+
+    numbers = tuple((n * 37) % 101 - 50 for n in range(500))
+
+    def check(self, summary, top_k):
+        """
+        Compare a summary with the expected result for self.numbers.
+        """
+        largest, smallest = max(self.numbers), min(self.numbers)
+        self.assertEqual(summary.largest, largest)
+        self.assertEqual(summary.largest_index, self.numbers.index(largest))
+        self.assertEqual(summary.smallest, smallest)
+        self.assertEqual(summary.smallest_index, self.numbers.index(smallest))
+        self.assertEqual(summary.top_k, sorted(self.numbers, reverse=True)[:top_k])
+
+    def test_chunked_iterable(self):
+        """
+        Test reducing an iterable over several chunks.
+        """
+        summary = summarize_numbers(
+            iter(self.numbers), top_k=10, with_min=True, chunk_size=64
+        )
+        self.check(summary, 10)
+
+    def test_binary_file(self):
+        """
+        Test reducing a binary file of int64 numbers.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "numbers.bin"
+            path.write_bytes(array("q", self.numbers).tobytes())
+            summary = summarize_numbers(path, top_k=5, with_min=True, chunk_size=64)
+            self.check(summary, 5)
+            self.assertEqual(find_largest_number(path), max(self.numbers))
+            with self.assertRaises(TypeError):
+                find_largest_number(str(path))
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_numpy_array_in_parallel(self):
+        """
+        Test reducing a NumPy array split across several threads.
+
+        With 500 items and 3 workers the parts start at 0, 166 and 333. Ties
+        for the largest and smallest number straddle those boundaries, so the
+        earliest index must win when the parts are combined.
+        """
+        numbers = [n % 50 for n in range(500)]
+        for index in (166, 333, 499):
+            numbers[index] = 100
+        for index in (165, 332):
+            numbers[index] = -100
+        with (
+            mock.patch.object(find_largest_number_module, "PARALLEL_THRESHOLD", 64),
+            mock.patch.object(
+                futures, "ThreadPoolExecutor", wraps=futures.ThreadPoolExecutor
+            ) as executor,
+        ):
+            summary = summarize_numbers(
+                np.array(numbers), top_k=5, with_min=True, chunk_size=32, workers=3
+            )
+        executor.assert_called_once_with(max_workers=3)
+        self.assertEqual((summary.largest, summary.largest_index), (100, 166))
+        self.assertEqual((summary.smallest, summary.smallest_index), (-100, 165))
+        self.assertEqual(summary.top_k, [100, 100, 100, 49, 49])
+
+    def test_largest_only(self):
+        """
+        Test that the extras are left unset unless requested.
+        """
+        summary = summarize_numbers([2, 8, 8, 1])
+        self.assertEqual((summary.largest, summary.largest_index), (8, 1))
+        self.assertIsNone(summary.smallest)
+        self.assertIsNone(summary.top_k)
+
+    def test_invalid_input(self):
+        """
+        Test handling of invalid arguments and truncated files.
+        """
+        with self.assertRaises(ValueError):
+            summarize_numbers([1, 2], top_k=-1)
+        with self.assertRaises(ValueError):
+            summarize_numbers([1, 2], chunk_size=0)
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "numbers.bin"
+            path.write_bytes(b"\x01\x02\x03")
+            with self.assertRaises(ValueError):
+                summarize_numbers(path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -10,7 +10,15 @@ Author: Emmanuel
 
 import unittest
 
-from ..find_the_maximum_of_two_numbers import find_the_maximum_of_two_numbers
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy is optional
+    np = None
+
+from ..find_the_maximum_of_two_numbers import (
+    find_the_maximum_of_two_numbers,
+    find_the_maximum_of_two_numbers_batch,
+)
 
 
 class TestFindMaximum(unittest.TestCase):
@@ -59,5 +67,62 @@ class TestFindMaxNumber(unittest.TestCase):
             find_the_maximum_of_two_numbers("three", 5)
 
 
+class TestFindMaxNumberBatch(unittest.TestCase):
+    """
+    Test cases for the find_the_maximum_of_two_numbers_batch function.
+    """
+
+    def test_max_of_two_lists(self):
+        """
+        Test the element-wise maximum of two lists.
+        """
+        result = find_the_maximum_of_two_numbers_batch([3, -3, 7, 0], [5, -5, 7, -1])
+        self.assertEqual(result, [5, -3, 7, 0])
+
+    def test_max_of_empty_lists(self):
+        """
+        Test the element-wise maximum of two empty lists.
+        """
+        self.assertEqual(find_the_maximum_of_two_numbers_batch([], []), [])
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_max_of_numpy_arrays(self):
+        """
+        Test the element-wise maximum of a NumPy array and a list.
+        """
+        result = find_the_maximum_of_two_numbers_batch(np.array([3, -3, 7]), [5, -5, 7])
+        self.assertEqual(result.tolist(), [5, -3, 7])
+        with self.assertRaises(AssertionError):
+            find_the_maximum_of_two_numbers_batch(np.array([1.5]), np.array([2]))
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_max_of_mixed_signedness(self):
+        """
+        Test that integer types are kept and signed ints with uint64 rejected.
+        """
+        result = find_the_maximum_of_two_numbers_batch(
+            np.array([-1, 2], dtype=np.int8), np.array([200, 1], dtype=np.uint8)
+        )
+        self.assertEqual(result.dtype.kind, "i")
+        self.assertEqual(result.tolist(), [200, 2])
+        with self.assertRaises(AssertionError):
+            find_the_maximum_of_two_numbers_batch(
+                np.array([-1]), np.array([2**63], dtype=np.uint64)
+            )
+
+    def test_invalid_input(self):
+        """
+        Test handling of invalid element types and mismatched lengths.
+        """
+        with self.assertRaises(AssertionError):
+            find_the_maximum_of_two_numbers_batch([3, 4], [5, "five"])
+        with self.assertRaises(AssertionError):
+            find_the_maximum_of_two_numbers_batch([3.0], [5])
+        with self.assertRaises(AssertionError):
+            find_the_maximum_of_two_numbers_batch([3, 4], [5, 6.5])
+        with self.assertRaises(AssertionError):
+            find_the_maximum_of_two_numbers_batch([3, 4], [5])
+
+
 if __name__ == "__main__":
     unittest.main()
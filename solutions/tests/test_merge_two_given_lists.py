@@ -10,9 +10,19 @@ Created on 2025-01-08
 @author: Ajanduna Emmanuel
 """
 
+import tempfile
+import tracemalloc
 import unittest
+from array import array
+from pathlib import Path
+from unittest import mock
 
-from ..merge_two_given_lists import merge_two_given_lists
+from ..merge_two_given_lists import (
+    MergedListView,
+    merge_list_files,
+    merge_sorted,
+    merge_two_given_lists,
+)
 
 
 class TestMergeTwoGivenLists(unittest.TestCase):
@@ -78,6 +88,326 @@ class TestMergeTwoGivenLists(unittest.TestCase):
         result = merge_two_given_lists([1, "a"], [2, "b"])
         self.assertEqual(result, [1, "a", 2, "b"])
 
+    def test_lazy_merge_returns_view(self):
+        """
+        Test that lazy merging returns a view without copying the lists.
+        """
+        list1, list2 = [1, 2, 3], [4, 5]
+        result = merge_two_given_lists(list1, list2, lazy=True)
+        self.assertIsInstance(result, MergedListView)
+        self.assertEqual(len(result), 5)
+        self.assertEqual(result.to_list(), [1, 2, 3, 4, 5])
+        list1[0] = 10
+        self.assertEqual(result[0], 10)
+
+    def test_lazy_merge_invalid_input(self):
+        """
+        Test that lazy merging still rejects non-list inputs.
+        """
+        with self.assertRaises(TypeError):
+            merge_two_given_lists([1, 2, 3], "not a list", lazy=True)
+
+
+class TestMergedListView(unittest.TestCase):
+    """
+    Test cases for the MergedListView class.
+    """
+
+    def setUp(self):
+        self.parts = [[1, 2, 3], [], ["a", "b"], [4, 5, 6, 7]]
+        self.expected = [1, 2, 3, "a", "b", 4, 5, 6, 7]
+        self.view = MergedListView(*self.parts)
+
+    def test_len_and_iteration(self):
+        """
+        Test the length, iteration and reverse iteration of a view.
+        """
+        self.assertEqual(len(self.view), len(self.expected))
+        self.assertEqual(list(self.view), self.expected)
+        self.assertEqual(list(reversed(self.view)), self.expected[::-1])
+
+    def test_indexing(self):
+        """
+        Test positive and negative indexing across the joined lists.
+        """
+        for index in range(-len(self.expected), len(self.expected)):
+            self.assertEqual(self.view[index], self.expected[index])
+        with self.assertRaises(IndexError):
+            self.view[len(self.expected)]
+        with self.assertRaises(TypeError):
+            self.view["0"]
+
+    def test_slicing(self):
+        """
+        Test that slices, including stepped ones, are views too.
+        """
+        for key in [slice(2, 7), slice(None, None, 2), slice(None, None, -3)]:
+            result = self.view[key]
+            self.assertIsInstance(result, MergedListView)
+            self.assertEqual(result.to_list(), self.expected[key])
+        self.assertEqual(self.view[1:8][::-2].to_list(), self.expected[1:8][::-2])
+
+    def test_sequence_methods(self):
+        """
+        Test the methods inherited from Sequence.
+        """
+        self.assertIn("a", self.view)
+        self.assertEqual(self.view.index(5), 6)
+        self.assertEqual(self.view.count(2), 1)
+
+    def test_invalid_input(self):
+        """
+        Test building a view from something that is not a sequence.
+        """
+        with self.assertRaises(TypeError):
+            MergedListView([1, 2], {3, 4})
+
+
+class TestMergeSorted(unittest.TestCase):
+    """
+    Test cases for the merge_sorted function and the sorted_merge mode.
+    """
+
+    def test_merge_many_sorted_iterables(self):
+        """
+        Test merging lists, tuples and generators that are already sorted.
+        """
+        result = merge_sorted([1, 4, 9], (2, 3, 10), (n * 2 for n in range(4)), [])
+        self.assertEqual(list(result), [0, 1, 2, 2, 3, 4, 4, 6, 9, 10])
+
+    def test_merge_is_lazy(self):
+        """
+        Test that items are pulled from the inputs only as needed.
+        """
+
+        def numbers():
+            yield 1
+            raise AssertionError("consumed too far")
+
+        result = merge_sorted(numbers(), [5, 6])
+        self.assertEqual(next(result), 1)
+
+    def test_merge_with_key(self):
+        """
+        Test merging iterables sorted by a key function.
+        """
+        result = merge_sorted(["b", "D"], ["A", "c"], key=str.lower)
+        self.assertEqual(list(result), ["A", "b", "c", "D"])
+
+    def test_merge_with_dedup(self):
+        """
+        Test that dedup gives the sorted union of the inputs.
+        """
+        result = merge_sorted([1, 2, 2, 5], [2, 3, 5], [5], dedup=True)
+        self.assertEqual(list(result), [1, 2, 3, 5])
+        result = merge_sorted(["a", "B"], ["A", "b"], key=str.lower, dedup=True)
+        self.assertEqual(list(result), ["a", "B"])
+
+    def test_sorted_merge_mode(self):
+        """
+        Test the sorted_merge mode of merge_two_given_lists.
+        """
+        result = merge_two_given_lists([1, 3, 5], iter([2, 3]), sorted_merge=True)
+        self.assertEqual(list(result), [1, 2, 3, 3, 5])
+        result = merge_two_given_lists([1, 3], [3, 4], sorted_merge=True, dedup=True)
+        self.assertEqual(list(result), [1, 3, 4])
+
+    def test_sorted_merge_rejects_lazy(self):
+        """
+        Test that sorted_merge and lazy cannot be combined.
+        """
+        with self.assertRaises(ValueError):
+            merge_two_given_lists([1], [2], lazy=True, sorted_merge=True)
+
+    def test_key_and_dedup_require_sorted_merge(self):
+        """
+        Test that key and dedup are rejected without sorted_merge.
+        """
+        with self.assertRaises(ValueError):
+            merge_two_given_lists([1], [2], dedup=True)
+        with self.assertRaises(ValueError):
+            merge_two_given_lists([1], [2], key=abs)
+        with self.assertRaises(ValueError):
+            merge_two_given_lists([1], [2], lazy=True, dedup=True)
+
+    def test_merge_sorted_invalid_input(self):
+        """
+        Test that non-iterable and string inputs are rejected.
+        """
+        with self.assertRaises(TypeError):
+            merge_sorted([1, 2], 3)
+        with self.assertRaises(TypeError):
+            merge_two_given_lists([1, 2], "not a list", sorted_merge=True)
+
+
+class TestMergeListFiles(unittest.TestCase):
+    """
+    Test cases for the merge_list_files function.
+    """
+
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.directory = Path(self._directory.name)
+        self.output = self.directory / "output"
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def write_text(self, name, lines):
+        path = self.directory / name
+        path.write_text("\n".join(lines), encoding="utf-8")
+        return path
+
+    def write_binary(self, name, numbers):
+        path = self.directory / name
+        path.write_bytes(array("q", numbers).tobytes())
+        return path
+
+    def read_binary(self):
+        return array("q", self.output.read_bytes()).tolist()
+
+    def test_concatenate_text_files(self):
+        """
+        Test concatenating text files, one without a final newline.
+        """
+        paths = [self.write_text("a", ["x", "y"]), self.write_text("b", ["z"])]
+        merge_list_files(paths, self.output)
+        self.assertEqual(self.output.read_text(encoding="utf-8"), "x\ny\nz\n")
+
+    def test_concatenate_binary_files(self):
+        """
+        Test concatenating binary int64 files.
+        """
+        paths = [self.write_binary("a", [3, 1]), self.write_binary("b", [2])]
+        merge_list_files(paths, self.output, typecode="q")
+        self.assertEqual(self.read_binary(), [3, 1, 2])
+
+    def test_merge_presorted_text_files(self):
+        """
+        Test merging already sorted text files with a numeric key.
+        """
+        paths = [self.write_text("a", ["1", "5", "10"]), self.write_text("b", ["2"])]
+        merge_list_files(paths, self.output, sorted_merge=True, key=int)
+        self.assertEqual(self.output.read_text().split(), ["1", "2", "5", "10"])
+
+    def test_merge_unsorted_binary_files_with_spilling(self):
+        """
+        Test sorting inputs larger than the memory budget through spilled runs.
+        """
+        first = [(n * 7919) % 1000 for n in range(1000)]
+        second = [(n * 104729) % 500 for n in range(800)]
+        paths = [self.write_binary("a", first), self.write_binary("b", second)]
+        merge_list_files(
+            paths,
+            self.output,
+            sorted_merge=True,
+            presorted=False,
+            typecode="q",
+            max_memory=16 * 1024,
+            buffer_size=256,
+        )
+        self.assertEqual(self.read_binary(), sorted(first + second))
+
+    def test_spill_to_temp_dir(self):
+        """
+        Test that runs are spilled in temp_dir and removed afterwards.
+        """
+        numbers = [(n * 7919) % 1000 for n in range(1000)]
+        temp_dir = self.directory / "spill"
+        temp_dir.mkdir()
+        with mock.patch(
+            "tempfile.TemporaryDirectory", wraps=tempfile.TemporaryDirectory
+        ) as temporary_directory:
+            merge_list_files(
+                [self.write_binary("a", numbers)],
+                self.output,
+                sorted_merge=True,
+                presorted=False,
+                typecode="q",
+                max_memory=16 * 1024,
+                buffer_size=256,
+                temp_dir=temp_dir,
+            )
+        temporary_directory.assert_called_once_with(dir=temp_dir)
+        self.assertEqual(self.read_binary(), sorted(numbers))
+        self.assertEqual(list(temp_dir.iterdir()), [])
+
+    def test_peak_memory_within_budget(self):
+        """
+        Test that spilling and multi-pass merging stay within max_memory.
+        """
+        numbers = [(n * 7919) % 30_011 for n in range(30_000)]
+        cases = [
+            ([self.write_binary("a", numbers)], "q", None, 128 * 1024),
+            ([self.write_text("b", map(str, numbers))], None, int, 256 * 1024),
+        ]
+        for paths, typecode, key, max_memory in cases:
+            with self.subTest(typecode=typecode):
+                tracemalloc.start()
+                try:
+                    merge_list_files(
+                        paths,
+                        self.output,
+                        sorted_merge=True,
+                        presorted=False,
+                        key=key,
+                        typecode=typecode,
+                        max_memory=max_memory,
+                        buffer_size=8 * 1024,
+                    )
+                    _, peak = tracemalloc.get_traced_memory()
+                finally:
+                    tracemalloc.stop()
+                self.assertLessEqual(peak, max_memory)
+        self.assertEqual(
+            self.output.read_text().split(), sorted(map(str, numbers), key=int)
+        )
+
+    def test_merge_with_dedup(self):
+        """
+        Test that dedup gives the sorted union of the files.
+        """
+        paths = [self.write_binary("a", [4, 1, 4]), self.write_binary("b", [1, 2])]
+        merge_list_files(
+            paths,
+            self.output,
+            sorted_merge=True,
+            presorted=False,
+            dedup=True,
+            typecode="q",
+        )
+        self.assertEqual(self.read_binary(), [1, 2, 4])
+
+    def test_invalid_input(self):
+        """
+        Test handling of invalid paths, sizes and truncated binary files.
+        """
+        path = self.write_text("a", ["1"])
+        with self.assertRaises(TypeError):
+            merge_list_files(str(path), self.output)
+        with self.assertRaises(ValueError):
+            merge_list_files([path], self.output, max_memory=0)
+        with self.assertRaises(ValueError):
+            merge_list_files([path], self.output, max_memory=10, buffer_size=100)
+        with self.assertRaises(ValueError):
+            merge_list_files([path], self.output, sorted_merge=True, typecode="q")
+
+    def test_output_is_an_input(self):
+        """
+        Test that an input is never overwritten by the output.
+        """
+        first = self.write_text("a", ["1", "3"])
+        second = self.write_text("b", ["2"])
+        for sorted_merge in (False, True):
+            with self.assertRaises(ValueError):
+                merge_list_files(
+                    [first, second], first, sorted_merge=sorted_merge, key=int
+                )
+            with self.assertRaises(ValueError):
+                merge_list_files([first, second], str(self.directory / "b"))
+        self.assertEqual(first.read_text(encoding="utf-8"), "1\n3")
+        self.assertEqual(second.read_text(encoding="utf-8"), "2")
+
 
 if __name__ == "__main__":
     unittest.main()